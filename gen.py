@@ -1,25 +1,33 @@
 import json
-import io
+import sys
+
+# orjson parses api.json noticeably faster, fall back to the stdlib json if its not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # TODO API NOT EXISTING
 # ui_menu_bar_begin _str8 version
 
 # exclude oc_* from any string
 def prefix_trim_oc(name):
-    if name.startswith("_oc_"): # some enums have this
-        return name[4:]
-
+    # most names have the plain prefix, check it first
     if name.startswith("oc_"):
         return name[3:]
 
+    if name.startswith("_oc_"): # some enums have this
+        return name[4:]
+
     return name
 
 def get_type_name_or_kind(obj):
     result = obj["kind"] # basic identifiers like f32, int, etc land here
     
     # if it contains an orca name, use that one instead
-    if "name" in obj:
-        result = prefix_trim_oc(obj["name"]) # names need to be trimmed
+    name = obj.get("name")
+    if name is not None:
+        result = prefix_trim_oc(name) # names need to be trimmed
     elif result == "bool":
         result = "c.bool"
 
@@ -61,13 +69,13 @@ def get_inner_kind(obj, field_name):
     return output
 
 # generate a single field key & value pair
-def gen_param(obj, file):
+def gen_param(obj, out):
     name = check_field_name(obj["name"]) # can be ... !
     
     # convert variadic-param to odin #c_vararg args: ..any
     variable_output = get_inner_kind(obj["type"], name)
     if name == "..." or variable_output == "va_list":
-        file.write("#c_vararg args: ..any")
+        out.append("#c_vararg args: ..any")
         return
 
     if name == "context": # context is a keyword in odin
@@ -76,23 +84,24 @@ def gen_param(obj, file):
     if name == "buffer" and variable_output == "cstring":
         variable_output = "[^]char"
 
-    file.write(f"{name}: {variable_output}")
+    out.append(name)
+    out.append(": ")
+    out.append(variable_output)
+
+# if the doc exists write it as a multi or single line doc dependant on whats provided
+def try_gen_doc(obj, out, indent):
+    doc = obj.get("doc")
+    if doc is None:
+        return
 
-# generate a multi or single line doc dependant on whats provided
-def gen_doc(obj, file, indent):
     indent_str = indent_string(indent)
-    if isinstance(obj, list):
-        file.write(f"{indent_str}/*\n")
-        for line in obj:
-            file.write(f"{indent_str}{line}\n")
-        file.write(f"{indent_str}*/\n")
+    if type(doc) is list:
+        out.append(f"{indent_str}/*\n")
+        for line in doc:
+            out.append(f"{indent_str}{line}\n")
+        out.append(f"{indent_str}*/\n")
     else:
-        file.write(f"{indent_str}// {obj}\n")
-
-# if the doc exists write it
-def try_gen_doc(obj, file, indent):
-    if "doc" in obj:
-        gen_doc(obj["doc"], file, indent)
+        out.append(f"{indent_str}// {doc}\n")
 
 # if a proc begins with abort or assert return true
 def proc_contains_panic(name):
@@ -102,50 +111,57 @@ def proc_contains_panic(name):
     return False
 
 # generate a procedure declation with the parameters and its return type
-def gen_proc(obj, name, write_foreign_finish, file, indent):
-    kind = obj["kind"]
+def gen_proc(obj, name, write_foreign_finish, out, indent):
     name = prefix_trim_oc(name)
 
-    try_gen_doc(obj, file, indent)
+    try_gen_doc(obj, out, indent)
     indent_str = indent_string(indent)
-    file.write(f"{indent_str}{name} :: proc(")
+    out.append(f"{indent_str}{name} :: proc(")
 
     # write params
+    append = out.append
+    param_gen = gen_param
     param_count = 0
     for param in obj["params"]:
         if param_count > 0:
-            file.write(", ")
+            append(", ")
 
-        gen_param(param, file)
+        param_gen(param, out)
         param_count += 1
 
-    file.write(")")
+    append(")")
 
     # write return type
     ret = obj["return"]
     if ret["kind"] == "void" and proc_contains_panic(name):
-        file.write(" -> !")
+        append(" -> !")
     elif ret["kind"] != "void":
         ret_kind = get_inner_kind(ret, "")
-        file.write(f" -> {ret_kind}")
+        append(f" -> {ret_kind}")
 
     # finish
     if write_foreign_finish:
-        file.write(" ---\n")
+        append(" ---\n")
     else:
-        file.write("\n")
+        append("\n")
+
+# precomputed indentation, nesting never goes deep
+indent_strings = tuple(sys.intern("\t" * indent) for indent in range(16))
 
 # add indentation 
 def indent_string(indent):
+    if indent < len(indent_strings):
+        return indent_strings[indent]
+
     return "\t" * indent
 
 # write spacers and actual module docs
-def gen_module_doc(obj, file):
+def gen_module_doc(obj, out):
     brief = obj["brief"]
     spacer = "//" * 40
-    file.write(spacer + "\n")
-    file.write(f"// {brief}\n")
-    file.write(spacer + "\n" * 2)
+    out.append(spacer + "\n")
+    out.append(f"// {brief}\n")
+    out.append(spacer + "\n" * 2)
 
 # easier builtins instead of struct+unions
 type_builtins = {
@@ -170,11 +186,11 @@ type_builtins = {
 }
 
 # generate a default builtin instead of complex xy or xywh C struct+union pairs
-def gen_type_builtins(name, file, indent):
+def gen_type_builtins(name, out, indent):
     if name in type_builtins:
         indent_str = indent_string(indent)
         output = type_builtins[name]
-        file.write(f"{indent_str}{name} :: {output}\n\n")
+        out.append(f"{indent_str}{name} :: {output}\n\n")
         return True
 
     return False
@@ -211,25 +227,40 @@ enum_prefixes_specific = {
     "OC_UI_EDIT_MOVE_",
 }
 
-# since the hashset above is unsorted these should be checked last
+# broad prefixes that specific ones extend, these should be checked last
 enum_prefixes_broad = {
     "OC_FILE_",
     "OC_UI_",
     "OC_IO_",
 }
 
+# character trie of all prefixes, the "" key marks the end of a prefix with its length
+# walking it finds the longest matching prefix, so specific prefixes always win over broad ones
+def build_prefix_trie(prefixes):
+    trie = {}
+    for prefix in prefixes:
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[""] = len(prefix)
+
+    return trie
+
+enum_prefix_trie = build_prefix_trie(enum_prefixes_specific | enum_prefixes_broad)
+
 # fixup enum names based on prefixes
 def simplify_enum_name(name):
-    for prefix in enum_prefixes_specific:
-        if name.startswith(prefix):
-            return name[len(prefix):]
+    # remember the deepest prefix end while walking the name
+    node = enum_prefix_trie
+    prefix_length = 0
+    for char in name:
+        node = node.get(char)
+        if node is None:
+            break
 
-    # check last
-    for prefix in enum_prefixes_broad:
-        if name.startswith(prefix):
-            return name[len(prefix):]
+        prefix_length = node.get("", prefix_length)
 
-    return name
+    return name[prefix_length:]
 
 # safety check since enum field names cant be only numbers
 # 0 would be turned to _0
@@ -253,70 +284,82 @@ enum_bit_sets_list = {
     "ui_flags": ["ui_flag", "ui_flags", "u32"],
 }
 
-def gen_enum_bit_set_combo(obj, file, name, indent):
+def gen_enum_bit_set_combo(obj, out, name, indent):
     is_bitset = name in enum_bit_sets_list
     if not is_bitset:
         return False
 
     indent_str = indent_string(indent)
+    append = out.append
     change = enum_bit_sets_list[name]
     enum_name = change[0]
     bitset_name = change[1]
     enum_sizing = change[2] # gotta use the same sizing for both, the origin enum
-    file.write(f"{indent_str}{enum_name} :: enum {enum_sizing} {{\n")
+    append(f"{indent_str}{enum_name} :: enum {enum_sizing} {{\n")
 
     # do not write out the value names of bit_set backing enum values
     # also drop the NONE = 0 value
     field_count = 0
     fields_indent_str = indent_string(indent + 1)
+    simplify = simplify_enum_name
     for const in obj["constants"]:
         real_name = const["name"]
-        const_name = simplify_enum_name(real_name)
+        const_name = simplify(real_name)
 
         if const_name == "NONE":
             continue
 
         # write docs if they exist
-        if "doc" in const:
-            const_docs = const["doc"]
-            file.write(f"{fields_indent_str}// {const_docs}\n")
+        const_docs = const.get("doc")
+        if const_docs is not None:
+            append(f"{fields_indent_str}// {const_docs}\n")
 
-        file.write(f"{fields_indent_str}{const_name}")
+        append(fields_indent_str)
+        append(const_name)
 
         # odin bit_set should start at 1
         if field_count == 0:
-            file.write(" = 1")
+            append(" = 1")
 
-        file.write(",\n")
+        append(",\n")
         field_count += 1
 
-    file.write(f"{indent_str}}}\n")
-    file.write(f"{indent_str}{bitset_name} :: bit_set[{enum_name}; {enum_sizing}]\n\n")
+    append(f"{indent_str}}}\n")
+    append(f"{indent_str}{bitset_name} :: bit_set[{enum_name}; {enum_sizing}]\n\n")
     return True
 
 # generates an odin enum e.g. log_level :: enum { ... }
-def gen_enum(obj, file, name, indent):
+def gen_enum(obj, out, name, indent):
     indent_str = indent_string(indent)
+    append = out.append
     singleton = len(obj["constants"]) <= 1 or name == ""
 
     name = get_enum_name(name)
 
-    if gen_enum_bit_set_combo(obj, file, name, indent):
+    if gen_enum_bit_set_combo(obj, out, name, indent):
         return
 
     # write enum description when not a singleton
     elif not singleton:
         enum_sizing = get_enum_sizing(obj)
-        file.write(f"{indent_str}{name} :: enum {enum_sizing} {{\n")
+        append(f"{indent_str}{name} :: enum {enum_sizing} {{\n")
         fields_indent_str = indent_string(indent + 1)
     else:
         fields_indent_str = indent_str
 
+    # make it a constant instead of an enum asignment
+    assignment = " :: " if singleton else " = "
+    line_end = "\n" if singleton else ",\n"
+
+    # local lookups for the per constant calls
+    simplify = simplify_enum_name
+    check_decimal = check_enum_name_decimal
+
     # write enum content from objects
     for const in obj["constants"]:
         real_name = const["name"]
-        const_name = simplify_enum_name(real_name)
-        const_name = check_enum_name_decimal(const_name)
+        const_name = simplify(real_name)
+        const_name = check_decimal(const_name)
         
         # Exception for OC_STYLE currently, write out constant names
         if real_name.startswith("OC_UI_STYLE"):
@@ -325,20 +368,20 @@ def gen_enum(obj, file, name, indent):
         const_value = const["value"]
 
         # write docs if they exist
-        if "doc" in const:
-            const_docs = const["doc"]
-            file.write(f"{fields_indent_str}// {const_docs}\n")
-
-        # make it a constant instead of an enum asignment
-        assignment = "::" if singleton else "="
+        const_docs = const.get("doc")
+        if const_docs is not None:
+            append(f"{fields_indent_str}// {const_docs}\n")
 
-        file.write(f"{fields_indent_str}{const_name} {assignment} {const_value}")
-        file.write("\n" if singleton else ",\n")
+        append(fields_indent_str)
+        append(const_name)
+        append(assignment)
+        append(str(const_value))
+        append(line_end)
 
     if singleton:
-        file.write("\n")
+        append("\n")
     else:
-        file.write(f"{indent_str}}}\n\n")
+        append(f"{indent_str}}}\n\n")
 
 
 # any oddities that need to be checked for field
@@ -357,15 +400,19 @@ def check_field_name(name):
     return name
 
 # generate raw unions fields
-def gen_union_fields(obj, file, indent):
+def gen_union_fields(obj, out, indent):
     if "fields" not in obj:
         print(f"FIELDS MISSED in union")
         return
 
     indent_str = indent_string(indent)
+    append = out.append
+    # local lookups for the per field calls
+    field_name_check = check_field_name
+    inner_kind = get_inner_kind
     for field in obj["fields"]:
-        field_name = check_field_name(field["name"])
-        field_kind = get_inner_kind(field["type"], field_name)
+        field_name = field_name_check(field["name"])
+        field_kind = inner_kind(field["type"], field_name)
 
         # name can be empty
         if field_name == "":
@@ -373,52 +420,64 @@ def gen_union_fields(obj, file, indent):
 
         # generate inner structs within a union
         if field_kind == "struct":
-            gen_struct(field["type"], file, field_name, indent)
+            gen_struct(field["type"], out, field_name, indent)
 
             # always comma separate
-            file.write(",\n")
+            append(",\n")
         elif field_kind == "array":
-            gen_fixed_array(field, file, field_name, indent)
+            gen_fixed_array(field, out, field_name, indent)
         else:
-            file.write(f"{indent_str}{field_name}: {field_kind},\n")
+            append(indent_str)
+            append(field_name)
+            append(": ")
+            append(field_kind)
+            append(",\n")
 
 # fixed size array in C
-def gen_fixed_array(obj, file, field_name, indent):
+def gen_fixed_array(obj, out, field_name, indent):
     indent_str = indent_string(indent)
     variable_type = obj["type"]
     array_size = variable_type["count"]
     array_type = get_inner_kind(variable_type["type"], "")
-    file.write(f"{indent_str}{field_name}: [{array_size}]{array_type},\n")
+    out.append(f"{indent_str}{field_name}: [{array_size}]{array_type},\n")
 
 # write struct fields from objects
-def gen_struct_fields(obj, file, indent):
+def gen_struct_fields(obj, out, indent):
     indent_str = indent_string(indent)
+    append = out.append
+    # local lookups for the per field calls
+    field_name_check = check_field_name
+    inner_kind = get_inner_kind
     for field in obj["fields"]:
-        field_name = check_field_name(field["name"])
-        variable_output = get_inner_kind(field["type"], field_name)
+        field_name = field_name_check(field["name"])
+        variable_output = inner_kind(field["type"], field_name)
 
         # write docs if they exist
-        if "doc" in field:
-            field_docs = field["doc"]
-            file.write(f"{indent_str}// {field_docs}\n")
+        field_docs = field.get("doc")
+        if field_docs is not None:
+            append(f"{indent_str}// {field_docs}\n")
 
         # convert inner unions to raw_unions structs
         if variable_output == "union":
             if field_name == "":
                 field_name = "_"
 
-            file.write(f"{indent_str}{field_name}: struct #raw_union {{\n")
+            append(f"{indent_str}{field_name}: struct #raw_union {{\n")
             variable_type = field["type"]
-            gen_union_fields(variable_type, file, indent + 1)
-            file.write(f"{indent_str}}},\n")
+            gen_union_fields(variable_type, out, indent + 1)
+            append(f"{indent_str}}},\n")
         elif variable_output == "array": 
-            gen_fixed_array(field, file, field_name, indent)
+            gen_fixed_array(field, out, field_name, indent)
         else:
-            file.write(f"{indent_str}{field_name}: {variable_output},\n")
+            append(indent_str)
+            append(field_name)
+            append(": ")
+            append(variable_output)
+            append(",\n")
 
-def gen_structs_manually(file, name):
+def gen_structs_manually(out, name):
     if name == "ui_layout":
-        file.write("""ui_layout :: struct {
+        out.append("""ui_layout :: struct {
 \taxis: ui_axis,
 \tspacing: f32,
 \tmargin: [2]f32,
@@ -429,31 +488,28 @@ def gen_structs_manually(file, name):
     return False
 
 # generate an odin struct with its fields
-def gen_struct(obj, file, name, indent):
+def gen_struct(obj, out, name, indent):
     indent_str = indent_string(indent)
 
     # just do this one manually
-    if gen_structs_manually(file, name):
+    if gen_structs_manually(out, name):
         return
     
     # if a struct doesnt have fields just skip fields
-    if "fields" not in obj:
-        file.write(f"{indent_str}{name} :: struct {{}}")
+    fields = obj.get("fields")
+    if fields is None:
+        out.append(f"{indent_str}{name} :: struct {{}}")
         return
 
     # check if its a handle struct only, convert that into a distinct handle
-    if len(obj["fields"]) == 1:
-        field = obj["fields"][0]
-        field_name = check_field_name(field["name"])
-
-        if field_name == "h":
-            file.write(f"{indent_str}{name} :: distinct u64")
-            return
+    if len(fields) == 1 and fields[0]["name"] == "h":
+        out.append(f"{indent_str}{name} :: distinct u64")
+        return
 
     seperator = " ::" if indent == 0 else ":"
-    file.write(f"{indent_str}{name}{seperator} struct {{\n")
-    gen_struct_fields(obj, file, indent + 1)
-    file.write(f"{indent_str}}}")
+    out.append(f"{indent_str}{name}{seperator} struct {{\n")
+    gen_struct_fields(obj, out, indent + 1)
+    out.append(f"{indent_str}}}")
 
 # constants to rename since their const version got removed
 enum_rename_list = {
@@ -485,82 +541,111 @@ typedef_ignore_list = {
 }
 
 # generates an odin constant
-def gen_typedef(obj, file, name, indent):
+def gen_typedef(obj, out, name, indent):
     indent_str = indent_string(indent)
     typedef_kind = obj["kind"]
 
     if name in typedef_ignore_list:
         return
 
-    file.write(f"{indent_str}{name} :: {typedef_kind}\n\n")
+    out.append(f"{indent_str}{name} :: {typedef_kind}\n\n")
+
+# typename struct, spaced out from the next object
+def gen_typename_struct(obj, out, name, indent):
+    gen_struct(obj, out, name, indent)
+    
+    # space out structs
+    out.append("\n\n")
+
+# unions on the top level are not generated yet, leave an empty placeholder
+def gen_typename_union(obj, out, name, indent):
+    print(f"union not done {name}")
+    out.append(f"{name} :: union {{}}\n\n")
+
+# typename procs are procedure types, not foreign declarations
+def gen_typename_proc(obj, out, name, indent):
+    gen_proc(obj, name, False, out, indent)
+    out.append("\n")
+
+# generators per typename kind, anything else is written as a typedef
+typename_generators = {
+    "struct": gen_typename_struct,
+    "union": gen_typename_union,
+    "enum": gen_enum,
+    "proc": gen_typename_proc,
+}
 
 # main object of the api which could be struct, union, enums or macros (unsupported)
-def gen_typename_object(obj, file, indent):
+def gen_typename_object(obj, out, indent):
     name = prefix_trim_oc(obj["name"])
-    try_gen_doc(obj, file, indent)
+    try_gen_doc(obj, out, indent)
 
     # try looking for a builtin match and leave early if written
-    if gen_type_builtins(name, file, indent):
+    if gen_type_builtins(name, out, indent):
         return
 
     variable_type = obj["type"]
-    kind = variable_type["kind"]
+    generator = typename_generators.get(variable_type["kind"], gen_typedef)
+    generator(variable_type, out, name, indent)
 
-    if kind == "struct":
-        gen_struct(variable_type, file, name, indent)
-        
-        # space out structs
-        file.write("\n\n")
-    elif kind == "union":
-        print(f"union not done {name}")
-        file.write(f"{name} :: union {{}}\n\n")
-    elif kind == "enum":
-        gen_enum(variable_type, file, name, indent)
-    elif kind == "proc":
-        gen_proc(variable_type, name, False, file, indent)
-        file.write("\n")
-    else: 
-        gen_typedef(variable_type, file, name, indent)
+# procedures go into the shared foreign block of their module
+def iterate_proc(obj, out, shared_block):
+    proc_name = obj["name"]
+    gen_proc(obj, proc_name, True, shared_block, 1)
+
+def iterate_typename(obj, out, shared_block):
+    gen_typename_object(obj, out, 0)
+
+# generators per module content kind, macros are unsupported and skipped
+object_generators = {
+    "proc": iterate_proc,
+    "typename": iterate_typename,
+}
+
+# wrapping of the procedures collected per module
+foreign_block_begin = "@(default_calling_convention=\"c\", link_prefix=\"oc_\")\nforeign {\n"
+foreign_block_end = "}\n\n"
 
 # step through the main module objects
 # procedures are written to a temp_block thats written once the module is stepped through
-def iterate_object(obj, file, shared_block):
+def iterate_object(obj, out, shared_block):
     if obj is None:
         return
 
     kind = obj["kind"]
-    if kind == "module":
-        gen_module_doc(obj, file)
 
-    temp_block = io.StringIO("")
+    # only modules collect their own procedures, anything else forwards the shared block
+    temp_block = shared_block
+    if kind == "module":
+        gen_module_doc(obj, out)
+        temp_block = []
 
     if "contents" in obj:
         for child in obj["contents"]:
-            iterate_object(child, file, temp_block)
+            iterate_object(child, out, temp_block)
 
     # finally write the procedures into the foreign block
     if kind == "module":
-        module_size = temp_block.tell()
-
         # skip empty modules
-        if module_size != 0:
-            file.write(f"@(default_calling_convention=\"c\", link_prefix=\"oc_\")\nforeign {{\n")
-            file.write(temp_block.getvalue())
-            file.write("}\n\n")
-
-        temp_block.seek(0)
-
-    temp_block.close()
-
-    if kind == "proc":
-        proc_name = obj["name"]
-        gen_proc(obj, proc_name, True, shared_block, 1)
-    elif kind == "typename":
-        gen_typename_object(obj, file, 0)
+        if temp_block:
+            out.append(foreign_block_begin)
+            out.append("".join(temp_block))
+            out.append(foreign_block_end)
+
+    generator = object_generators.get(kind)
+    if generator is not None:
+        generator(obj, out, shared_block)
+
+# generate a top level module into its own block of text
+# modules don't depend on each other, so they can be generated in any order or separately
+def gen_module(obj):
+    out = []
+    iterate_object(obj, out, [])
+    return "".join(out)
 
 # write package info and types
-def write_package(file):
-    file.write("""//+build orca
+def write_package(out):
+    out.append("""//+build orca
 package orca
 
 import "core:c"
@@ -579,8 +664,8 @@ pool :: struct {
 
 """)
 
-def write_unicode_constants(file):
-    file.write("""UNICODE_BASIC_LATIN :: unicode_range { 0x0000, 127 }
+def write_unicode_constants(out):
+    out.append("""UNICODE_BASIC_LATIN :: unicode_range { 0x0000, 127 }
 UNICODE_C1_CONTROLS_AND_LATIN_1_SUPPLEMENT :: unicode_range { 0x0080, 127 }
 UNICODE_LATIN_EXTENDED_A :: unicode_range { 0x0100, 127 }
 UNICODE_LATIN_EXTENDED_B :: unicode_range { 0x0180, 207 }
@@ -706,8 +791,8 @@ UNICODE_SUPPLEMENTARY_PRIVATE_USE_AREA_A :: unicode_range { 0xf0000, 65533 }
 UNICODE_SUPPLEMENTARY_PRIVATE_USE_AREA_B  :: unicode_range { 0x100000, 65533 }
 """)
 
-def write_clock(file):
-    file.write("""
+def write_clock(out):
+    out.append("""
 clock_kind :: enum c.int {
 \tMONOTONIC,
 \tUPTIME,
@@ -720,8 +805,8 @@ foreign {
 }
 """)
 
-def write_helpers(file):
-    file.write("""
+def write_helpers(out):
+    out.append("""
 file_write_slice :: proc(file: file, slice: []char) -> u64 {
 \treturn file_write(file, u64(len(slice)), raw_data(slice))
 }
@@ -760,8 +845,8 @@ STYLE_LAYOUT :: 504
 STYLE_FLOAT :: 1536
 STYLE_MASK_INHERITED :: 985088
 '''
-def write_style_bitset(file):
-    file.write("""
+def write_style_bitset(out):
+    out.append("""
 style_enum :: enum {
 \tSIZE_WIDTH = 1,
 \tSIZE_HEIGHT,
@@ -800,8 +885,8 @@ MASK_INHERITED :: ui_style_mask { .COLOR, .FONT, .FONT_SIZE, .ANIMATION_TIME, .A
 
 """)
 
-def write_externs(file):
-    file.write("""@(link_prefix="OC_")
+def write_externs(out):
+    out.append("""@(link_prefix="OC_")
 foreign {
 \tUI_DARK_THEME: ui_theme
 \tUI_LIGHT_THEME: ui_theme
@@ -812,8 +897,8 @@ foreign {
 
 """)
 
-def write_system_error_definition(file):
-    file.write("""
+def write_system_error_definition(out):
+    out.append("""
 SYS_MAX_ERROR :: 1024
 
 sys_err_def :: struct {
@@ -827,21 +912,29 @@ foreign {
 }
 """)
 
+# run next to api.json with `python gen.py`, only the stdlib is required (orjson is optional)
+# so the generator also runs unchanged under pypy3 for faster generation
 if __name__ == "__main__":
-    with open("api.json", "r") as api_file:
-        api_desc = json.load(api_file)
+    with open("api.json", "rb") as api_file:
+        api_data = api_file.read()
+
+    if orjson is not None:
+        api_desc = orjson.loads(api_data)
+    else:
+        api_desc = json.loads(api_data)
+
+    # everything is collected first and written out at once
+    output = []
+    write_package(output)
+    write_externs(output)
+    write_system_error_definition(output)
+    write_unicode_constants(output)
+    write_clock(output)
+    write_helpers(output)
+    write_style_bitset(output)
+
+    for module in api_desc:
+        output.append(gen_module(module))
 
     with open("orca.odin", "w") as odin_file:
-        write_package(odin_file)
-        write_externs(odin_file)
-        write_system_error_definition(odin_file)
-        write_unicode_constants(odin_file)
-        write_clock(odin_file)
-        write_helpers(odin_file)
-        write_style_bitset(odin_file)
-        temp_block = io.StringIO("")
-        
-        for module in api_desc:
-            iterate_object(module, odin_file, temp_block)
-        
-        temp_block.close()
\ No newline at end of file
+        odin_file.write("".join(output))
\ No newline at end of file